@@ -2,7 +2,7 @@
 
 import { useEffect, useState, Suspense } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
-import { DotLottieReact } from '@lottiefiles/dotlottie-react';
+import { DotLottieReact } from "@/components/ui/lottie";
 import { useDispatch, useSelector } from 'react-redux';
 import { AppDispatch, RootState } from '@/store';
 import { fetchAgents, createAgent, updateAgent, deleteAgent, calculateSalary, sendMessage, assignTask, setGoal, setSelectedAgent } from '@/store/slices/agentSlice';
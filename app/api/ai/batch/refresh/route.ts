@@ -0,0 +1,40 @@
+import { NextRequest, NextResponse } from "next/server";
+import { connectDB } from "@/lib/db";
+import { parseCohort, scoreCohort, getTtlSeconds } from "@/lib/ai-scoring";
+
+// Scoring a large cohort can take minutes
+export const maxDuration = 300;
+
+// Re-scores the default cohort (policies due within 90 days) that the
+// dashboard reads. Called by the Vercel cron in vercel.json, which sends
+// `Authorization: Bearer $CRON_SECRET`; the schedule runs well inside the
+// default score TTL so the dashboard never goes empty between runs.
+export async function GET(request: NextRequest) {
+  const secret = process.env.CRON_SECRET;
+  if (!secret || request.headers.get('authorization') !== `Bearer ${secret}`) {
+    return NextResponse.json(
+      { success: false, error: "Unauthorized" },
+      { status: 401 }
+    );
+  }
+
+  try {
+    await connectDB();
+
+    const run = await scoreCohort(parseCohort(), getTtlSeconds(undefined));
+    if (!run) {
+      return NextResponse.json(
+        { success: false, error: "Scoring already in progress for this cohort" },
+        { status: 409 }
+      );
+    }
+
+    return NextResponse.json({ success: true, data: run });
+  } catch (error) {
+    console.error("Scheduled scoring error:", error);
+    return NextResponse.json(
+      { success: false, error: "Batch scoring unavailable" },
+      { status: 500 }
+    );
+  }
+}
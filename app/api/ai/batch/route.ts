@@ -0,0 +1,111 @@
+import { NextRequest, NextResponse } from "next/server";
+import { connectDB } from "@/lib/db";
+import { PredictionScore } from "@/models/PredictionScore";
+import { parseCohort, getCohortKey, getTtlSeconds, scoreCohort, getCohortSummary } from "@/lib/ai-scoring";
+
+const SORT_FIELDS = ['renewalProbability', 'churnRisk', 'fraudProbability'];
+
+// Scores a cohort of policies and caches the results.
+// Body: { cohort: { dueWithinDays, status, category }, ttlSeconds, refresh }
+// Returns the cached scores while they are fresh, unless `refresh` is set.
+// Only one run per cohort at a time; a concurrent request gets 409.
+export async function POST(request: NextRequest) {
+  try {
+    await connectDB();
+
+    const body = await request.json().catch(() => ({}));
+    const cohort = parseCohort(body.cohort);
+    const cohortKey = getCohortKey(cohort);
+
+    if (!body.refresh) {
+      const summary = await getCohortSummary(cohortKey);
+      if (summary) {
+        return NextResponse.json({ success: true, cached: true, data: summary });
+      }
+    }
+
+    const run = await scoreCohort(cohort, getTtlSeconds(body.ttlSeconds));
+    if (!run) {
+      return NextResponse.json(
+        { success: false, error: "Scoring already in progress for this cohort" },
+        { status: 409 }
+      );
+    }
+    const summary = run.size > 0 ? await getCohortSummary(cohortKey) : null;
+
+    return NextResponse.json({
+      success: true,
+      cached: false,
+      data: summary || { ...run, renewal: null, churn: null, fraud: null, upsell: null },
+    });
+  } catch (error) {
+    console.error("Batch scoring error:", error);
+    return NextResponse.json(
+      { success: false, error: "Batch scoring unavailable" },
+      { status: 500 }
+    );
+  }
+}
+
+// Reads precomputed scores; never triggers scoring.
+//   ?view=summary                    cohort rollup for dashboards
+//   ?sortBy=renewalProbability&order=asc&limit=100&page=1   per-policy scores, e.g. lapse campaigns
+//   ?policyId=... / ?customerEmail=...                       scores for one policy or customer
+// The cohort is selected with the same dueWithinDays/status/category params as POST.
+export async function GET(request: NextRequest) {
+  try {
+    await connectDB();
+
+    const searchParams = request.nextUrl.searchParams;
+    const cohortKey = getCohortKey(parseCohort(Object.fromEntries(searchParams)));
+
+    if (searchParams.get('view') === 'summary') {
+      const summary = await getCohortSummary(cohortKey);
+      if (!summary) {
+        return NextResponse.json(
+          { success: false, error: "No precomputed scores for this cohort" },
+          { status: 404 }
+        );
+      }
+      return NextResponse.json({ success: true, data: summary });
+    }
+
+    const page = parseInt(searchParams.get('page') || '1');
+    const limit = Math.min(parseInt(searchParams.get('limit') || '50'), 1000);
+    const sortBy = SORT_FIELDS.includes(searchParams.get('sortBy') || '') ? searchParams.get('sortBy')! : 'renewalProbability';
+    const order = searchParams.get('order') === 'desc' ? -1 : 1;
+    const policyId = searchParams.get('policyId');
+    const customerEmail = searchParams.get('customerEmail');
+
+    // Match getCohortSummary: expired scores may linger until the TTL monitor runs
+    const query: any = { cohortKey, expiresAt: { $gt: new Date() } };
+    if (policyId) query.policyId = policyId;
+    if (customerEmail) query.customerEmail = customerEmail;
+
+    const [scores, total] = await Promise.all([
+      PredictionScore.find(query)
+        .sort({ [sortBy]: order, policyId: 1 })
+        .skip((page - 1) * limit)
+        .limit(limit)
+        .lean(),
+      PredictionScore.countDocuments(query),
+    ]);
+
+    return NextResponse.json({
+      success: true,
+      data: scores,
+      pagination: {
+        page,
+        limit,
+        total,
+        pages: Math.ceil(total / limit),
+      },
+    });
+  } catch (error) {
+    console.error("Batch scores fetch error:", error);
+    return NextResponse.json(
+      { success: false, error: "Failed to fetch scores" },
+      { status: 500 }
+    );
+  }
+}
@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
+import { predictPolicyRenewal, predictCustomerChurn, detectFraud, recommendUpsell } from "@/lib/ai-scoring";
 
 interface PredictionRequest {
   type: 'renewal' | 'churn' | 'fraud' | 'upsell';
@@ -101,104 +102,6 @@ export async function GET(request: NextRequest) {
   }
 }
 
-// AI/ML Prediction Functions
-async function predictPolicyRenewal(customerData: any) {
-  // Simulated ML prediction - in production, use actual ML model
-  const baseScore = Math.random();
-  const factors = {
-    premiumHistory: customerData.premiumHistory || 0.3,
-    claimHistory: customerData.claimHistory || 0.2,
-    customerAge: customerData.age ? Math.min(customerData.age / 100, 1) : 0.5,
-    policyDuration: customerData.policyDuration ? Math.min(customerData.policyDuration / 10, 1) : 0.5
-  };
-  
-  const renewalScore = baseScore * 0.4 + 
-    factors.premiumHistory * 0.3 + 
-    (1 - factors.claimHistory) * 0.2 + 
-    factors.policyDuration * 0.1;
-  
-  return {
-    probability: Math.max(0, Math.min(1, renewalScore)),
-    confidence: 0.85,
-    factors: factors,
-    recommendation: renewalScore > 0.7 ? 'High likelihood of renewal' : 'Consider retention strategy'
-  };
-}
-
-async function predictCustomerChurn(customerData: any) {
-  const riskFactors = {
-    missedPayments: customerData.missedPayments || 0,
-    complaints: customerData.complaints || 0,
-    policyLapses: customerData.policyLapses || 0,
-    interactionFrequency: customerData.interactions || 5
-  };
-  
-  const churnRisk = (riskFactors.missedPayments * 0.4) + 
-    (riskFactors.complaints * 0.3) + 
-    (riskFactors.policyLapses * 0.2) + 
-    (1 / riskFactors.interactionFrequency * 0.1);
-  
-  return {
-    riskScore: Math.max(0, Math.min(1, churnRisk)),
-    confidence: 0.82,
-    riskFactors: riskFactors,
-    recommendation: churnRisk > 0.6 ? 'High churn risk - intervention needed' : 'Low risk - maintain current strategy'
-  };
-}
-
-async function detectFraud(claimData: any) {
-  const fraudIndicators = {
-    claimAmount: claimData.amount > 500000 ? 0.3 : 0.1,
-    timeSincePolicy: claimData.timeSincePolicy < 30 ? 0.4 : 0.1,
-    previousClaims: claimData.previousClaims > 3 ? 0.3 : 0.1,
-    documentIssues: claimData.documentIssues || 0
-  };
-  
-  const fraudScore = Object.values(fraudIndicators).reduce((a, b) => a + b, 0);
-  
-  return {
-    fraudProbability: Math.max(0, Math.min(1, fraudScore)),
-    confidence: 0.78,
-    indicators: fraudIndicators,
-    recommendation: fraudScore > 0.5 ? 'Manual review required' : 'Standard processing'
-  };
-}
-
-async function recommendUpsell(customerData: any) {
-  const customerProfile = {
-    age: customerData.age || 35,
-    income: customerData.income || 500000,
-    existingPolicies: customerData.policies || [],
-    familySize: customerData.familySize || 1
-  };
-  
-  const recommendations = [];
-  
-  if (customerProfile.age < 40 && customerProfile.familySize > 1) {
-    recommendations.push({
-      product: 'Term Life Plus',
-      reason: 'Young family with dependents',
-      confidence: 0.85,
-      estimatedPremium: 15000
-    });
-  }
-  
-  if (customerProfile.income > 1000000) {
-    recommendations.push({
-      product: 'Wealth Builder',
-      reason: 'High income - investment opportunity',
-      confidence: 0.75,
-      estimatedPremium: 50000
-    });
-  }
-  
-  return {
-    recommendations: recommendations,
-    customerProfile: customerProfile,
-    nextBestAction: recommendations.length > 0 ? 'Contact customer for consultation' : 'Focus on retention'
-  };
-}
-
 // Advanced Analytics Functions
 async function getCustomerAnalytics(timeframe: string) {
   // Simulated analytics data
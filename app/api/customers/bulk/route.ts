@@ -0,0 +1,72 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { connectDB } from '@/lib/db';
+import { Customer } from '@/models/Customer';
+import { exportResponse, importResponse } from '@/lib/bulk';
+import { validateCustomerRecord } from '@/lib/validation';
+
+const EXPORT_COLUMNS = [
+  'customerId', 'name', 'email', 'phone', 'dateOfBirth', 'gender', 'address', 'city', 'state',
+  'pincode', 'panNumber', 'aadhaarNumber', 'agentId', 'status', 'kycStatus', 'totalPremium',
+  'totalClaims', 'lastPolicyDate', 'createdAt', 'updatedAt',
+];
+
+// Streams customers as NDJSON (default) or CSV (?format=csv)
+export async function GET(request: NextRequest) {
+  try {
+    await connectDB();
+
+    const { searchParams } = new URL(request.url);
+    const status = searchParams.get('status');
+    const kycStatus = searchParams.get('kycStatus');
+    const agentId = searchParams.get('agentId');
+
+    const filter: any = {};
+    if (status) filter.status = status;
+    if (kycStatus) filter.kycStatus = kycStatus;
+    if (agentId) filter.agentId = agentId;
+
+    return exportResponse(request, {
+      entity: 'customers',
+      model: Customer,
+      filter,
+      columns: EXPORT_COLUMNS,
+    });
+  } catch (error) {
+    console.error('Error exporting customers:', error);
+    return NextResponse.json(
+      { success: false, error: 'Failed to export customers' },
+      { status: 500 }
+    );
+  }
+}
+
+// Imports customers from an NDJSON or CSV body, streaming progress events back
+export async function POST(request: NextRequest) {
+  try {
+    await connectDB();
+
+    return await importResponse(request, {
+      entity: 'customers',
+      model: Customer,
+      key: 'email',
+      validate: validateCustomerRecord,
+      toDocument: (record) => {
+        const { __v, ...customer } = record;
+        return {
+          status: 'active',
+          kycStatus: 'pending',
+          ...customer,
+          email: String(record.email).trim().toLowerCase(),
+        };
+      },
+      auditAction: 'BULK_IMPORT_CUSTOMERS',
+      auditEntityType: 'Customer',
+    });
+  } catch (error) {
+    console.error('Error importing customers:', error);
+    return NextResponse.json(
+      { success: false, error: 'Failed to import customers' },
+      { status: 500 }
+    );
+  }
+}
@@ -0,0 +1,44 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { connectDB } from '@/lib/db';
+import { ImportJob } from '@/models/ImportJob';
+
+// Progress of bulk imports started through the /bulk endpoints
+export async function GET(request: NextRequest) {
+  try {
+    await connectDB();
+
+    const { searchParams } = new URL(request.url);
+    const jobId = searchParams.get('jobId');
+    const entity = searchParams.get('entity');
+    const status = searchParams.get('status');
+
+    if (jobId) {
+      const job = await ImportJob.findOne({ jobId }).lean();
+      if (!job) {
+        return NextResponse.json(
+          { success: false, error: 'Import job not found' },
+          { status: 404 }
+        );
+      }
+      return NextResponse.json({ success: true, data: job });
+    }
+
+    const query: any = {};
+    if (entity) query.entity = entity;
+    if (status) query.status = status;
+
+    const jobs = await ImportJob.find(query)
+      .select({ rejected: 0 })
+      .sort({ createdAt: -1 })
+      .limit(50)
+      .lean();
+
+    return NextResponse.json({ success: true, data: jobs });
+  } catch (error) {
+    console.error('Error fetching import jobs:', error);
+    return NextResponse.json(
+      { success: false, error: 'Failed to fetch import jobs' },
+      { status: 500 }
+    );
+  }
+}
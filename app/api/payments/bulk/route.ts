@@ -0,0 +1,82 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { connectDB } from '@/lib/db';
+import { Payment } from '@/models/Payment';
+import { exportResponse, importResponse } from '@/lib/bulk';
+import { validatePaymentRecord } from '@/lib/validation';
+
+const EXPORT_COLUMNS = [
+  'transactionId', 'customerId', 'policyId', 'amount', 'paymentMethod', 'status', 'paymentDate',
+  'dueDate', 'receiptNumber', 'description', 'createdAt', 'updatedAt',
+];
+
+// Streams payments as NDJSON (default) or CSV (?format=csv)
+export async function GET(request: NextRequest) {
+  try {
+    await connectDB();
+
+    const { searchParams } = new URL(request.url);
+    const status = searchParams.get('status');
+    const customerId = searchParams.get('customerId');
+    const policyId = searchParams.get('policyId');
+    const startDate = searchParams.get('startDate');
+    const endDate = searchParams.get('endDate');
+
+    const filter: any = {};
+    if (status) filter.status = status;
+    if (customerId) filter.customerId = customerId;
+    if (policyId) filter.policyId = policyId;
+
+    if (startDate || endDate) {
+      filter.paymentDate = {};
+      if (startDate) filter.paymentDate.$gte = new Date(startDate);
+      if (endDate) filter.paymentDate.$lte = new Date(endDate);
+    }
+
+    return exportResponse(request, {
+      entity: 'payments',
+      model: Payment,
+      filter,
+      columns: EXPORT_COLUMNS,
+    });
+  } catch (error) {
+    console.error('Error exporting payments:', error);
+    return NextResponse.json(
+      { success: false, error: 'Failed to export payments' },
+      { status: 500 }
+    );
+  }
+}
+
+// Imports payments from an NDJSON or CSV body, streaming progress events back
+export async function POST(request: NextRequest) {
+  try {
+    await connectDB();
+
+    return await importResponse(request, {
+      entity: 'payments',
+      model: Payment,
+      key: 'transactionId',
+      validate: validatePaymentRecord,
+      // Generated identifiers are derived from the job and record number so a
+      // resumed upload produces the same keys and is deduped, not re-inserted.
+      toDocument: (record, index, jobId) => {
+        const { __v, ...payment } = record;
+        return {
+          status: 'pending',
+          ...payment,
+          amount: Number(record.amount),
+          transactionId: record.transactionId || `TXN-${jobId}-${index}`,
+          receiptNumber: record.receiptNumber || `RCP-${jobId}-${index}`,
+        };
+      },
+      auditAction: 'BULK_IMPORT_PAYMENTS',
+      auditEntityType: 'Payment',
+    });
+  } catch (error) {
+    console.error('Error importing payments:', error);
+    return NextResponse.json(
+      { success: false, error: 'Failed to import payments' },
+      { status: 500 }
+    );
+  }
+}
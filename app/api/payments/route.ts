@@ -1,37 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { connectDB } from '@/lib/db';
-import mongoose from 'mongoose';
+import { Payment } from '@/models/Payment';
 import { createAuditLog } from '@/lib/audit';
 
-const PaymentSchema = new mongoose.Schema(
-  {
-    transactionId: { type: String, unique: true },
-    customerId: mongoose.Schema.Types.ObjectId,
-    policyId: mongoose.Schema.Types.ObjectId,
-    amount: Number,
-    paymentMethod: {
-      type: String,
-      enum: ['credit_card', 'debit_card', 'net_banking', 'upi', 'cheque'],
-    },
-    status: {
-      type: String,
-      enum: ['pending', 'completed', 'failed', 'refunded'],
-      default: 'pending',
-    },
-    paymentDate: Date,
-    dueDate: Date,
-    receiptNumber: String,
-    description: String,
-    gatewayResponse: mongoose.Schema.Types.Mixed,
-    createdAt: { type: Date, default: Date.now },
-    updatedAt: { type: Date, default: Date.now },
-  },
-  { timestamps: true }
-);
-
-const Payment =
-  mongoose.models.Payment || mongoose.model('Payment', PaymentSchema);
-
 export async function GET(request: NextRequest) {
   try {
     await connectDB();
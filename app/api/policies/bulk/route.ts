@@ -0,0 +1,72 @@
+import { NextRequest, NextResponse } from 'next/server';
+import connectDB from '@/lib/mongoose';
+import Policy from '@/models/Policy';
+import { exportResponse, importResponse } from '@/lib/bulk';
+import { validatePolicyRecord } from '@/lib/validation';
+
+const EXPORT_COLUMNS = [
+  'policyId', 'customerEmail', 'customerName', 'type', 'category', 'premium', 'sumAssured',
+  'status', 'startDate', 'endDate', 'nextPremium', 'customerImage', 'createdAt', 'updatedAt',
+];
+
+// Streams policies as NDJSON (default) or CSV (?format=csv)
+export async function GET(request: NextRequest) {
+  try {
+    const { searchParams } = new URL(request.url);
+    const email = searchParams.get('email');
+    const type = searchParams.get('type');
+    const status = searchParams.get('status');
+
+    await connectDB();
+
+    const filter: any = {};
+    if (email) filter.customerEmail = email;
+    if (type && type !== 'all') filter.category = type;
+    if (status && status !== 'all') filter.status = status;
+
+    return exportResponse(request, {
+      entity: 'policies',
+      model: Policy,
+      filter,
+      columns: EXPORT_COLUMNS,
+    });
+  } catch (error) {
+    console.error('Export policies error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
+
+// Imports policies from an NDJSON or CSV body, streaming progress events back
+export async function POST(request: NextRequest) {
+  try {
+    await connectDB();
+
+    return await importResponse(request, {
+      entity: 'policies',
+      model: Policy,
+      key: 'policyId',
+      validate: validatePolicyRecord,
+      toDocument: (record) => {
+        const { __v, ...policy } = record;
+        return {
+          ...policy,
+          policyId: String(record.policyId).trim(),
+          customerEmail: String(record.customerEmail).trim(),
+          premium: String(record.premium),
+          sumAssured: String(record.sumAssured),
+        };
+      },
+      auditAction: 'BULK_IMPORT_POLICIES',
+      auditEntityType: 'Policy',
+    });
+  } catch (error) {
+    console.error('Import policies error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
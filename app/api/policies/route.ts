@@ -26,6 +26,31 @@ export async function GET(request: NextRequest) {
       query.status = status;
     }
 
+    // Paginate when requested; full extracts should use /api/policies/bulk
+    const page = parseInt(searchParams.get('page') || '0');
+    const limit = Math.min(parseInt(searchParams.get('limit') || '0'), 500);
+
+    if (page > 0 && limit > 0) {
+      const [policies, total] = await Promise.all([
+        Policy.find(query)
+          .sort({ createdAt: -1 })
+          .skip((page - 1) * limit)
+          .limit(limit)
+          .lean(),
+        Policy.countDocuments(query),
+      ]);
+
+      return NextResponse.json({
+        policies,
+        pagination: {
+          page,
+          limit,
+          total,
+          pages: Math.ceil(total / limit),
+        },
+      });
+    }
+
     const policies = await Policy.find(query).sort({ createdAt: -1 });
 
     return NextResponse.json({ policies });
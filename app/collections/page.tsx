@@ -2,8 +2,7 @@
 
 import { useEffect, useState, Suspense } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
-import { DotLottieReact } from '@lottiefiles/dotlottie-react';
-import { jsPDF } from 'jspdf';
+import { DotLottieReact } from "@/components/ui/lottie";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
@@ -279,11 +278,18 @@ function CollectionsPageContent() {
     alert(`Reminder sent to ${customer.customerName} via SMS and Email`);
   };
 
-  const handleGenerateReceipt = (payment: any) => {
-    generateReceiptPDF(payment);
+  const handleGenerateReceipt = async (payment: any) => {
+    try {
+      await generateReceiptPDF(payment);
+    } catch (error) {
+      console.error("Error generating receipt:", error);
+      alert(`Failed to generate receipt for payment ${payment.id}. Please try again.`);
+    }
   };
 
-  const generateReceiptPDF = (payment: any) => {
+  const generateReceiptPDF = async (payment: any) => {
+    // jsPDF is only needed once a receipt is requested, so load it on demand
+    const { jsPDF } = await import('jspdf');
     const doc = new jsPDF();
     
     // Add LIC Logo placeholder (you can replace with actual logo)
@@ -361,7 +367,7 @@ function CollectionsPageContent() {
     // Generate receipts for all payments
     paymentRecords.forEach((payment, index) => {
       setTimeout(() => {
-        generateReceiptPDF(payment);
+        handleGenerateReceipt(payment);
       }, index * 1000); // 1 second delay between each PDF
     });
     
@@ -359,7 +359,7 @@ export default function LoansBankingSection() {
         createdAt: new Date().toISOString(),
       };
 
-      const pdf = generateLoanPDF(pdfData);
+      const pdf = await generateLoanPDF(pdfData);
       pdf.save(`LIC_Loan_Application_${result.loanId}.pdf`);
 
       setSubmittedLoanId(result.loanId);
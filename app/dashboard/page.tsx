@@ -3,8 +3,8 @@
 import { useEffect, useState, Suspense } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
 import Image from "next/image";
-import { DotLottieReact } from '@lottiefiles/dotlottie-react';
-import { PieChart, Pie, Cell, Legend, Tooltip, ResponsiveContainer } from "recharts";
+import { DotLottieReact } from "@/components/ui/lottie";
+import dynamic from "next/dynamic";
 import { Menubar, MenubarContent, MenubarItem, MenubarMenu, MenubarSeparator, MenubarTrigger } from "@/components/ui/menubar";
 import { AlertDialog, AlertDialogAction, AlertDialogCancel, AlertDialogContent, AlertDialogDescription, AlertDialogFooter, AlertDialogHeader, AlertDialogTitle, AlertDialogTrigger } from "@/components/ui/alert-dialog";
 import { Button } from "@/components/ui/button";
@@ -18,17 +18,20 @@ import Navbar from "@/components/layout/navbar";
 import ProfileSidebar from "@/components/layout/profile-sidebar";
 import { BreadcrumbNav } from "@/components/features/breadcrumb-nav";
 import { CalendarHolidays } from "@/components/features/calendar-holidays";
-import { IndianStockMarket } from "@/components/features/indian-stock-market";
 import { NewsVideos } from "@/components/features/news-videos";
 import { WeatherWidget } from "@/components/features/weather-widget";
 import { AIInsights } from "@/components/features/ai-insights";
-import { AdvancedAnalytics } from "@/components/features/advanced-analytics";
-import { InfrastructureMonitoring } from "@/components/features/infrastructure-monitoring";
 import { PaginatedTable } from "@/components/features/paginated-table";
 import { DashboardSkeleton } from "@/components/features/dashboard-skeleton";
 import { MiniMusicPlayer } from "@/components/features/mini-music-player";
 import DocumentsSidebar from "@/components/layout/documents-sidebar";
 
+// recharts-based widgets are split into their own chunks and loaded on the client only
+const PortfolioMixChart = dynamic(() => import("@/components/features/portfolio-mix-chart").then((mod) => mod.PortfolioMixChart), { ssr: false });
+const IndianStockMarket = dynamic(() => import("@/components/features/indian-stock-market").then((mod) => mod.IndianStockMarket), { ssr: false });
+const AdvancedAnalytics = dynamic(() => import("@/components/features/advanced-analytics").then((mod) => mod.AdvancedAnalytics), { ssr: false });
+const InfrastructureMonitoring = dynamic(() => import("@/components/features/infrastructure-monitoring").then((mod) => mod.InfrastructureMonitoring), { ssr: false });
+
 function DashboardPageContent() {
   const router = useRouter();
   const searchParams = useSearchParams();
@@ -457,36 +460,7 @@ function DashboardPageContent() {
                           <span className="text-xs text-gray-500">Life / Health / Other</span>
                         </div>
                         <div className="h-44 sm:h-52 rounded-lg border border-dashed border-gray-200 flex items-center justify-center bg-white/50">
-                          <ResponsiveContainer width="100%" height={200}>
-                            <PieChart>
-                              <Pie
-                                data={[
-                                  { name: "Life Insurance", value: 55, color: "#3b82f6" },
-                                  { name: "Health Insurance", value: 30, color: "#10b981" },
-                                  { name: "Other", value: 15, color: "#f59e0b" }
-                                ]}
-                                cx="50%"
-                                cy="50%"
-                                innerRadius={40}
-                                outerRadius={70}
-                                paddingAngle={2}
-                                dataKey="value"
-                              >
-                                <Cell fill="#3b82f6" />
-                                <Cell fill="#10b981" />
-                                <Cell fill="#f59e0b" />
-                              </Pie>
-                              <Tooltip 
-                                formatter={(value) => `${value}%`}
-                                contentStyle={{ backgroundColor: "#fff", border: "1px solid #e5e7eb", borderRadius: "6px" }}
-                              />
-                              <Legend 
-                                verticalAlign="bottom" 
-                                height={36}
-                                formatter={(value) => value}
-                              />
-                            </PieChart>
-                          </ResponsiveContainer>
+                          <PortfolioMixChart />
                         </div>
                       </div>
 
@@ -2,8 +2,7 @@
 
 import { useEffect, useState, Suspense } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
-import { DotLottieReact } from '@lottiefiles/dotlottie-react';
-import { jsPDF } from 'jspdf';
+import { DotLottieReact } from "@/components/ui/lottie";
 import { AlertCircleIcon, CheckCircle2Icon } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
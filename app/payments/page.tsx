@@ -20,13 +20,15 @@ import { X } from "lucide-react";
 import Navbar from "@/components/layout/navbar";
 import ProfileSidebar from "@/components/layout/profile-sidebar";
 import { BreadcrumbNav } from "@/components/features/breadcrumb-nav";
-import CertificateGenerator from "@/components/certificate/certificate-generator";
 import { PaymentsManagementComponent } from "@/components/features/payments-management";
 import { PaginatedTable } from "@/components/features/paginated-table";
 import { DashboardSkeleton } from "@/components/features/dashboard-skeleton";
-import jsPDF from 'jspdf';
 // @ts-ignore - QRCode types not available
 import QRCode from 'qrcode';
+import dynamic from "next/dynamic";
+
+// jsPDF/html2canvas are only pulled in once a certificate dialog is opened
+const CertificateGenerator = dynamic(() => import("@/components/certificate/certificate-generator"), { ssr: false });
 
 function PaymentsPageContent() {
   const router = useRouter();
@@ -346,7 +348,8 @@ function PaymentsPageContent() {
   };
 
   const handleDownloadCertificate = async (payment: any) => {
-    // Create a new PDF document
+    // jsPDF is only needed once a certificate is downloaded, so load it on demand
+    const { default: jsPDF } = await import('jspdf');
     const doc = new jsPDF();
     
     // Generate QR code for verification
@@ -2,7 +2,7 @@
 
 import { useEffect, useState, Suspense } from "react";
 import { useRouter } from "next/navigation";
-import { DotLottieReact } from '@lottiefiles/dotlottie-react';
+import { DotLottieReact } from "@/components/ui/lottie";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
@@ -19,9 +19,12 @@ import { Search, Filter, X } from "lucide-react";
 import Navbar from "@/components/layout/navbar";
 import ProfileSidebar from "@/components/layout/profile-sidebar";
 import { BreadcrumbNav } from "@/components/features/breadcrumb-nav";
-import CertificateGenerator from "@/components/certificate/certificate-generator";
 import { PaginatedTable } from "@/components/features/paginated-table";
 import { DashboardSkeleton } from "@/components/features/dashboard-skeleton";
+import dynamic from "next/dynamic";
+
+// jsPDF/html2canvas are only pulled in once a certificate dialog is opened
+const CertificateGenerator = dynamic(() => import("@/components/certificate/certificate-generator"), { ssr: false });
 
 function PoliciesPageContent() {
   const router = useRouter();
@@ -10,8 +10,6 @@ import { Dialog, DialogContent, DialogDescription, DialogFooter, DialogHeader, D
 import { Alert, AlertDescription } from "@/components/ui/alert";
 import { Badge } from "@/components/ui/badge";
 import DigitalSignature from "@/components/ui/digital-signature";
-import jsPDF from "jspdf";
-import html2canvas from "html2canvas";
 import QRCode from "qrcode";
 
 interface CertificateData {
@@ -530,6 +528,12 @@ export default function CertificateGenerator({
       // Wait for content to render
       await new Promise(resolve => setTimeout(resolve, 500));
 
+      // The PDF/canvas libraries are large, so they are fetched only when a certificate is generated
+      const [{ default: html2canvas }, { default: jsPDF }] = await Promise.all([
+        import("html2canvas"),
+        import("jspdf"),
+      ]);
+
       // Generate canvas from the iframe body
       const canvas = await html2canvas(iframeDoc.body, {
         scale: 2,
@@ -74,65 +74,15 @@ export function AIInsights() {
 
   const fetchPredictions = async () => {
     try {
-      // Fetch renewal predictions
-      const renewalResponse = await fetch('/api/ai', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          type: 'renewal',
-          data: { sampleCustomers: 10 }
-        })
-      });
-      
-      // Fetch churn predictions
-      const churnResponse = await fetch('/api/ai', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          type: 'churn',
-          data: { sampleCustomers: 10 }
-        })
-      });
+      // Only read precomputed portfolio scores; scoring runs server-side via POST /api/ai/batch
+      const response = await fetch('/api/ai/batch?view=summary');
+      const result = await response.json();
+      const summary = result.success ? result.data : null;
 
-      // Fetch fraud detection
-      const fraudResponse = await fetch('/api/ai', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          type: 'fraud',
-          data: { sampleClaims: 5 }
-        })
-      });
-
-      // Fetch upsell recommendations
-      const upsellResponse = await fetch('/api/ai', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          type: 'upsell',
-          data: { sampleCustomers: 10 }
-        })
-      });
-
-      const results = await Promise.allSettled([
-        renewalResponse.json(),
-        churnResponse.json(),
-        fraudResponse.json(),
-        upsellResponse.json()
-      ]);
-
-      if (results[0].status === 'fulfilled' && results[0].value.success) {
-        setRenewalPredictions([results[0].value.prediction]);
-      }
-      if (results[1].status === 'fulfilled' && results[1].value.success) {
-        setChurnPredictions([results[1].value.prediction]);
-      }
-      if (results[2].status === 'fulfilled' && results[2].value.success) {
-        setFraudDetections([results[2].value.prediction]);
-      }
-      if (results[3].status === 'fulfilled' && results[3].value.success) {
-        setUpsellRecommendations([results[3].value.prediction]);
-      }
+      setRenewalPredictions(summary?.renewal ? [summary.renewal] : []);
+      setChurnPredictions(summary?.churn ? [summary.churn] : []);
+      setFraudDetections(summary?.fraud ? [summary.fraud] : []);
+      setUpsellRecommendations(summary?.upsell ? [summary.upsell] : []);
     } catch (error) {
       console.error('Error fetching predictions:', error);
     }
@@ -0,0 +1,40 @@
+"use client";
+
+import { PieChart, Pie, Cell, Legend, Tooltip, ResponsiveContainer } from "recharts";
+
+const PORTFOLIO_MIX = [
+  { name: "Life Insurance", value: 55, color: "#3b82f6" },
+  { name: "Health Insurance", value: 30, color: "#10b981" },
+  { name: "Other", value: 15, color: "#f59e0b" }
+];
+
+export function PortfolioMixChart() {
+  return (
+    <ResponsiveContainer width="100%" height={200}>
+      <PieChart>
+        <Pie
+          data={PORTFOLIO_MIX}
+          cx="50%"
+          cy="50%"
+          innerRadius={40}
+          outerRadius={70}
+          paddingAngle={2}
+          dataKey="value"
+        >
+          {PORTFOLIO_MIX.map((entry) => (
+            <Cell key={entry.name} fill={entry.color} />
+          ))}
+        </Pie>
+        <Tooltip 
+          formatter={(value) => `${value}%`}
+          contentStyle={{ backgroundColor: "#fff", border: "1px solid #e5e7eb", borderRadius: "6px" }}
+        />
+        <Legend 
+          verticalAlign="bottom" 
+          height={36}
+          formatter={(value) => value}
+        />
+      </PieChart>
+    </ResponsiveContainer>
+  );
+}
@@ -0,0 +1,10 @@
+"use client"
+
+import dynamic from "next/dynamic"
+
+// The dotLottie player ships its own WASM renderer, so it is split out of the
+// route bundles and only fetched once an animation is actually rendered.
+export const DotLottieReact = dynamic(
+  () => import("@lottiefiles/dotlottie-react").then((mod) => mod.DotLottieReact),
+  { ssr: false }
+)
@@ -0,0 +1,640 @@
+import { PipelineStage } from 'mongoose';
+import Policy from '@/models/Policy';
+import { Customer } from '@/models/Customer';
+import { Claim } from '@/models/Claim';
+import { Payment } from '@/models/Payment';
+import { PredictionScore } from '@/models/PredictionScore';
+import { ScoringLock } from '@/models/ScoringLock';
+import { parseAmount } from '@/lib/validation';
+
+// Rule-based scoring used by /api/ai. The single-entity predictions and the
+// batch portfolio mode share the same formulas, so a policy scored in a batch
+// gets the same numbers it would get from a one-off request. All scores are
+// deterministic: the same inputs and `asOf` date always give the same output.
+
+export const SCORING_MODEL_VERSION = 'rules-v1';
+
+const DAY_MS = 1000 * 60 * 60 * 24;
+const YEAR_MS = DAY_MS * 365.25;
+const DEFAULT_DUE_WITHIN_DAYS = 90;
+const DEFAULT_TTL_SECONDS = 6 * 60 * 60;
+const MAX_TTL_SECONDS = 7 * 24 * 60 * 60;
+const WRITE_CHUNK_SIZE = 1000;
+// Lease on a scoring run, renewed before every write; a lock not renewed
+// within this window is treated as abandoned
+const SCORING_LOCK_MS = 10 * 60 * 1000;
+
+const clamp01 = (value: number) => Math.max(0, Math.min(1, value));
+
+export interface UpsellRecommendation {
+  product: string;
+  reason: string;
+  confidence: number;
+  estimatedPremium: number;
+}
+
+// ---------------------------------------------------------------------------
+// Scoring formulas
+// ---------------------------------------------------------------------------
+
+export function renewalScore(paymentReliability: number, premiumHistory: number, claimHistory: number, policyDuration: number) {
+  return clamp01(
+    paymentReliability * 0.4 +
+    premiumHistory * 0.3 +
+    (1 - claimHistory) * 0.2 +
+    policyDuration * 0.1
+  );
+}
+
+export const renewalRecommendation = (score: number) =>
+  score > 0.7 ? 'High likelihood of renewal' : 'Consider retention strategy';
+
+export function churnScore(missedPayments: number, complaints: number, policyLapses: number, interactions: number) {
+  return clamp01(
+    missedPayments * 0.4 +
+    complaints * 0.3 +
+    policyLapses * 0.2 +
+    (1 / Math.max(interactions, 1)) * 0.1
+  );
+}
+
+export const churnRecommendation = (score: number) =>
+  score > 0.6 ? 'High churn risk - intervention needed' : 'Low risk - maintain current strategy';
+
+export function fraudIndicators(amount: number, daysSincePolicy: number, previousClaims: number, documentIssues: number) {
+  return {
+    claimAmount: amount > 500000 ? 0.3 : 0.1,
+    timeSincePolicy: daysSincePolicy < 30 ? 0.4 : 0.1,
+    previousClaims: previousClaims > 3 ? 0.3 : 0.1,
+    documentIssues: documentIssues || 0,
+  };
+}
+
+export const fraudRecommendation = (score: number) =>
+  score > 0.5 ? 'Manual review required' : 'Standard processing';
+
+export function upsellRecommendations(age: number, income: number, familySize: number): UpsellRecommendation[] {
+  const recommendations: UpsellRecommendation[] = [];
+
+  if (age < 40 && familySize > 1) {
+    recommendations.push({
+      product: 'Term Life Plus',
+      reason: 'Young family with dependents',
+      confidence: 0.85,
+      estimatedPremium: 15000
+    });
+  }
+
+  if (income > 1000000) {
+    recommendations.push({
+      product: 'Wealth Builder',
+      reason: 'High income - investment opportunity',
+      confidence: 0.75,
+      estimatedPremium: 50000
+    });
+  }
+
+  return recommendations;
+}
+
+// ---------------------------------------------------------------------------
+// Single-entity predictions (POST /api/ai)
+// ---------------------------------------------------------------------------
+
+export function predictPolicyRenewal(customerData: any) {
+  const factors = {
+    // Share of premiums paid on time; replaces the old random base score
+    paymentReliability: customerData.paymentReliability ?? 0.5,
+    premiumHistory: customerData.premiumHistory || 0.3,
+    claimHistory: customerData.claimHistory || 0.2,
+    customerAge: customerData.age ? Math.min(customerData.age / 100, 1) : 0.5,
+    policyDuration: customerData.policyDuration ? Math.min(customerData.policyDuration / 10, 1) : 0.5
+  };
+
+  const probability = renewalScore(
+    factors.paymentReliability,
+    factors.premiumHistory,
+    factors.claimHistory,
+    factors.policyDuration
+  );
+
+  return {
+    probability,
+    confidence: 0.85,
+    factors: factors,
+    recommendation: renewalRecommendation(probability)
+  };
+}
+
+export function predictCustomerChurn(customerData: any) {
+  const riskFactors = {
+    missedPayments: customerData.missedPayments || 0,
+    complaints: customerData.complaints || 0,
+    policyLapses: customerData.policyLapses || 0,
+    interactionFrequency: customerData.interactions || 5
+  };
+
+  const riskScore = churnScore(
+    riskFactors.missedPayments,
+    riskFactors.complaints,
+    riskFactors.policyLapses,
+    riskFactors.interactionFrequency
+  );
+
+  return {
+    riskScore,
+    confidence: 0.82,
+    riskFactors: riskFactors,
+    recommendation: churnRecommendation(riskScore)
+  };
+}
+
+export function detectFraud(claimData: any) {
+  const indicators = fraudIndicators(
+    claimData.amount,
+    claimData.timeSincePolicy,
+    claimData.previousClaims,
+    claimData.documentIssues
+  );
+
+  const fraudScore = Object.values(indicators).reduce((a, b) => a + b, 0);
+
+  return {
+    fraudProbability: clamp01(fraudScore),
+    confidence: 0.78,
+    indicators: indicators,
+    recommendation: fraudRecommendation(fraudScore)
+  };
+}
+
+export function recommendUpsell(customerData: any) {
+  const customerProfile = {
+    age: customerData.age || 35,
+    income: customerData.income || 500000,
+    existingPolicies: customerData.policies || [],
+    familySize: customerData.familySize || 1
+  };
+
+  const recommendations = upsellRecommendations(customerProfile.age, customerProfile.income, customerProfile.familySize);
+
+  return {
+    recommendations: recommendations,
+    customerProfile: customerProfile,
+    nextBestAction: recommendations.length > 0 ? 'Contact customer for consultation' : 'Focus on retention'
+  };
+}
+
+// ---------------------------------------------------------------------------
+// Batch portfolio scoring (/api/ai/batch)
+// ---------------------------------------------------------------------------
+
+export interface CohortQuery {
+  dueWithinDays: number;
+  status?: string;
+  category?: string;
+}
+
+export function parseCohort(source: Record<string, any> = {}): CohortQuery {
+  const dueWithinDays = parseInt(source.dueWithinDays);
+  return {
+    dueWithinDays: dueWithinDays > 0 ? dueWithinDays : DEFAULT_DUE_WITHIN_DAYS,
+    status: source.status || undefined,
+    category: source.category && source.category !== 'all' ? source.category : undefined,
+  };
+}
+
+export function getCohortKey(cohort: CohortQuery): string {
+  return [
+    `due:${cohort.dueWithinDays}`,
+    `status:${cohort.status || 'open'}`,
+    `category:${cohort.category || 'all'}`,
+  ].join('|');
+}
+
+export function getTtlSeconds(ttlSeconds: any): number {
+  const ttl = parseInt(ttlSeconds);
+  if (!ttl || ttl < 60) {
+    return DEFAULT_TTL_SECONDS;
+  }
+  return Math.min(ttl, MAX_TTL_SECONDS);
+}
+
+// Policies whose next premium falls due within the window (including ones
+// already overdue). Expired policies are left out unless asked for.
+function buildCohortFilter(cohort: CohortQuery, asOf: Date) {
+  const filter: any = {
+    nextPremium: { $lte: new Date(asOf.getTime() + cohort.dueWithinDays * DAY_MS) },
+  };
+  filter.status = cohort.status ? cohort.status : { $in: ['active', 'pending'] };
+  if (cohort.category) filter.category = cohort.category;
+  return filter;
+}
+
+// One aggregation pass over policies that joins the customer, their payments,
+// their other policies and the policy's claims, and reduces each to the
+// numeric features the scoring formulas need. Money fields are stored as
+// display strings ("₹50,00,000"), so they are returned raw and parsed in
+// buildFeatureMatrix.
+function buildFeaturePipeline(cohort: CohortQuery, asOf: Date): PipelineStage[] {
+  return [
+    { $match: buildCohortFilter(cohort, asOf) },
+    {
+      $project: {
+        policyId: 1,
+        customerEmail: 1,
+        startDate: 1,
+        nextPremium: 1,
+        premium: 1,
+        sumAssured: 1,
+      },
+    },
+    // The lookups join on indexed fields with localField/foreignField, so each
+    // policy costs index seeks rather than collection scans (MongoDB 5.0+).
+    { $addFields: { customerEmailLower: { $toLower: '$customerEmail' } } },
+    {
+      $lookup: {
+        from: Customer.collection.name,
+        localField: 'customerEmailLower',
+        foreignField: 'email',
+        pipeline: [{ $project: { dateOfBirth: 1 } }, { $limit: 1 }],
+        as: 'customer',
+      },
+    },
+    // `false` never matches, so policies without a customer record get no payments
+    { $addFields: { customerId: { $ifNull: [{ $arrayElemAt: ['$customer._id', 0] }, false] } } },
+    {
+      $lookup: {
+        from: Payment.collection.name,
+        localField: 'customerId',
+        foreignField: 'customerId',
+        pipeline: [
+          {
+            $group: {
+              _id: null,
+              count: { $sum: 1 },
+              completed: { $sum: { $cond: [{ $eq: ['$status', 'completed'] }, 1, 0] } },
+              missed: {
+                $sum: {
+                  $cond: [
+                    {
+                      $or: [
+                        { $eq: ['$status', 'failed'] },
+                        { $and: [{ $eq: ['$status', 'pending'] }, { $lt: ['$dueDate', asOf] }] },
+                      ],
+                    },
+                    1,
+                    0,
+                  ],
+                },
+              },
+            },
+          },
+        ],
+        as: 'payments',
+      },
+    },
+    {
+      $lookup: {
+        from: Claim.collection.name,
+        localField: 'policyId',
+        foreignField: 'policyId',
+        pipeline: [
+          {
+            $group: {
+              _id: null,
+              count: { $sum: 1 },
+              rejected: { $sum: { $cond: [{ $eq: ['$status', 'rejected'] }, 1, 0] } },
+              amounts: { $push: '$amount' },
+              firstFiled: { $min: '$dateFiled' },
+            },
+          },
+        ],
+        as: 'claims',
+      },
+    },
+    {
+      $lookup: {
+        from: Policy.collection.name,
+        localField: 'customerEmail',
+        foreignField: 'customerEmail',
+        pipeline: [
+          {
+            $group: {
+              _id: null,
+              count: { $sum: 1 },
+              expired: { $sum: { $cond: [{ $eq: ['$status', 'expired'] }, 1, 0] } },
+            },
+          },
+        ],
+        as: 'portfolio',
+      },
+    },
+    {
+      $project: {
+        _id: 0,
+        policyId: 1,
+        customerEmail: 1,
+        startDate: 1,
+        nextPremium: 1,
+        premium: 1,
+        sumAssured: 1,
+        dateOfBirth: { $arrayElemAt: ['$customer.dateOfBirth', 0] },
+        paymentCount: { $ifNull: [{ $arrayElemAt: ['$payments.count', 0] }, 0] },
+        completedPayments: { $ifNull: [{ $arrayElemAt: ['$payments.completed', 0] }, 0] },
+        missedPayments: { $ifNull: [{ $arrayElemAt: ['$payments.missed', 0] }, 0] },
+        claimCount: { $ifNull: [{ $arrayElemAt: ['$claims.count', 0] }, 0] },
+        rejectedClaims: { $ifNull: [{ $arrayElemAt: ['$claims.rejected', 0] }, 0] },
+        claimAmounts: { $ifNull: [{ $arrayElemAt: ['$claims.amounts', 0] }, []] },
+        firstClaimFiled: { $arrayElemAt: ['$claims.firstFiled', 0] },
+        portfolioPolicies: { $ifNull: [{ $arrayElemAt: ['$portfolio.count', 0] }, 1] },
+        expiredPolicies: { $ifNull: [{ $arrayElemAt: ['$portfolio.expired', 0] }, 0] },
+      },
+    },
+    // Stable order so repeated runs produce identical output
+    { $sort: { policyId: 1 } },
+  ];
+}
+
+const FEATURE_NAMES = [
+  'ageYears', 'policyYears', 'daysToDue', 'premium', 'sumAssured', 'paymentCount', 'completedPayments',
+  'missedPayments', 'claimCount', 'rejectedClaims', 'maxClaimAmount', 'daysToFirstClaim',
+  'portfolioPolicies', 'expiredPolicies',
+] as const;
+
+type FeatureName = typeof FEATURE_NAMES[number];
+
+export interface FeatureMatrix {
+  size: number;
+  policyId: string[];
+  customerEmail: string[];
+  columns: Record<FeatureName, Float64Array>;
+}
+
+export async function buildFeatureMatrix(cohort: CohortQuery, asOf: Date): Promise<FeatureMatrix> {
+  const rows = await Policy.aggregate(buildFeaturePipeline(cohort, asOf)).allowDiskUse(true);
+  const size = rows.length;
+  const columns = Object.fromEntries(
+    FEATURE_NAMES.map((name) => [name, new Float64Array(size)])
+  ) as Record<FeatureName, Float64Array>;
+  const policyId: string[] = new Array(size);
+  const customerEmail: string[] = new Array(size);
+  const now = asOf.getTime();
+
+  rows.forEach((row: any, i: number) => {
+    const start = row.startDate ? new Date(row.startDate).getTime() : now;
+    policyId[i] = row.policyId;
+    customerEmail[i] = row.customerEmail;
+    columns.ageYears[i] = row.dateOfBirth ? (now - new Date(row.dateOfBirth).getTime()) / YEAR_MS : NaN;
+    columns.policyYears[i] = Math.max(0, (now - start) / YEAR_MS);
+    columns.daysToDue[i] = row.nextPremium ? (new Date(row.nextPremium).getTime() - now) / DAY_MS : 0;
+    columns.premium[i] = parseAmount(row.premium);
+    columns.sumAssured[i] = parseAmount(row.sumAssured);
+    columns.paymentCount[i] = row.paymentCount;
+    columns.completedPayments[i] = row.completedPayments;
+    columns.missedPayments[i] = row.missedPayments;
+    columns.claimCount[i] = row.claimCount;
+    columns.rejectedClaims[i] = row.rejectedClaims;
+    columns.maxClaimAmount[i] = row.claimAmounts.reduce((max: number, amount: unknown) => Math.max(max, parseAmount(amount)), 0);
+    columns.daysToFirstClaim[i] = row.firstClaimFiled ? (new Date(row.firstClaimFiled).getTime() - start) / DAY_MS : NaN;
+    columns.portfolioPolicies[i] = row.portfolioPolicies;
+    columns.expiredPolicies[i] = row.expiredPolicies;
+  });
+
+  return { size, policyId, customerEmail, columns };
+}
+
+export interface ScoreColumns {
+  renewal: Float64Array;
+  churn: Float64Array;
+  fraud: Float64Array;
+  upsell: UpsellRecommendation[][];
+}
+
+// Scores the whole cohort column-wise in one pass over typed arrays instead
+// of building a request object per row.
+export function scoreFeatureMatrix(matrix: FeatureMatrix): ScoreColumns {
+  const { size, columns: c } = matrix;
+  const renewal = new Float64Array(size);
+  const churn = new Float64Array(size);
+  const fraud = new Float64Array(size);
+  const upsell: UpsellRecommendation[][] = new Array(size);
+
+  for (let i = 0; i < size; i++) {
+    const settled = c.completedPayments[i] + c.missedPayments[i];
+    const reliability = settled > 0 ? c.completedPayments[i] / settled : 0.5;
+    const premiumHistory = Math.min(c.completedPayments[i] / 12, 1);
+    const claimHistory = Math.min(c.claimCount[i] / 5, 1);
+    const duration = Math.min(c.policyYears[i] / 10, 1);
+    renewal[i] = renewalScore(reliability, premiumHistory, claimHistory, duration);
+
+    // Rejected claims stand in for complaints; every payment or claim counts as an interaction
+    churn[i] = churnScore(
+      c.missedPayments[i],
+      c.rejectedClaims[i],
+      c.expiredPolicies[i],
+      c.paymentCount[i] + c.claimCount[i]
+    );
+
+    if (c.claimCount[i] > 0) {
+      const indicators = fraudIndicators(c.maxClaimAmount[i], c.daysToFirstClaim[i], c.claimCount[i], 0);
+      fraud[i] = clamp01(indicators.claimAmount + indicators.timeSincePolicy + indicators.previousClaims);
+    }
+
+    // Sum assured is typically sized at ~10x annual income
+    const age = Number.isNaN(c.ageYears[i]) ? 35 : c.ageYears[i];
+    const income = c.sumAssured[i] > 0 ? c.sumAssured[i] / 10 : 500000;
+    upsell[i] = upsellRecommendations(age, income, 1);
+  }
+
+  return { renewal, churn, fraud, upsell };
+}
+
+// Takes the per-cohort scoring lock. Only one run per cohort can hold it at a
+// time, across all server instances; returns false if another run holds it.
+async function acquireScoringLock(cohortKey: string, runId: string): Promise<boolean> {
+  const now = new Date();
+  try {
+    await ScoringLock.findOneAndUpdate(
+      { cohortKey, lockedUntil: { $lt: now } },
+      { $set: { runId, lockedUntil: new Date(now.getTime() + SCORING_LOCK_MS) } },
+      { upsert: true }
+    );
+    return true;
+  } catch (error: any) {
+    // The upsert collides with the unique cohortKey while the lock is held
+    if (error?.code === 11000) {
+      return false;
+    }
+    throw error;
+  }
+}
+
+// Extends this run's lock. Returns false once another run has taken it over
+// (the lock expired), in which case this run must stop writing.
+async function renewScoringLock(cohortKey: string, runId: string): Promise<boolean> {
+  const result = await ScoringLock.updateOne(
+    { cohortKey, runId },
+    { $set: { lockedUntil: new Date(Date.now() + SCORING_LOCK_MS) } }
+  );
+  return result.matchedCount > 0;
+}
+
+// Scores a cohort and replaces its cached scores. Returns null when another
+// run for the same cohort is in progress or took over this run's lock.
+export async function scoreCohort(cohort: CohortQuery, ttlSeconds: number) {
+  const cohortKey = getCohortKey(cohort);
+  const runId = `${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
+
+  if (!(await acquireScoringLock(cohortKey, runId))) {
+    return null;
+  }
+
+  try {
+    return await runScoring(cohort, cohortKey, runId, ttlSeconds);
+  } finally {
+    await ScoringLock.deleteOne({ cohortKey, runId }).catch(() => {});
+  }
+}
+
+async function runScoring(cohort: CohortQuery, cohortKey: string, runId: string, ttlSeconds: number) {
+  const computedAt = new Date();
+  const expiresAt = new Date(computedAt.getTime() + ttlSeconds * 1000);
+
+  const matrix = await buildFeatureMatrix(cohort, computedAt);
+  const scores = scoreFeatureMatrix(matrix);
+
+  for (let offset = 0; offset < matrix.size; offset += WRITE_CHUNK_SIZE) {
+    if (!(await renewScoringLock(cohortKey, runId))) {
+      return null;
+    }
+
+    const ops = [];
+    const end = Math.min(offset + WRITE_CHUNK_SIZE, matrix.size);
+
+    for (let i = offset; i < end; i++) {
+      const features: Record<string, number | null> = {};
+      for (const name of FEATURE_NAMES) {
+        const value = matrix.columns[name][i];
+        features[name] = Number.isNaN(value) ? null : Math.round(value * 100) / 100;
+      }
+
+      ops.push({
+        updateOne: {
+          filter: { cohortKey, policyId: matrix.policyId[i] },
+          update: {
+            $set: {
+              customerEmail: matrix.customerEmail[i],
+              renewalProbability: scores.renewal[i],
+              churnRisk: scores.churn[i],
+              fraudProbability: scores.fraud[i],
+              upsell: scores.upsell[i],
+              features,
+              modelVersion: SCORING_MODEL_VERSION,
+              computedAt,
+              expiresAt,
+            },
+          },
+          upsert: true,
+        },
+      });
+    }
+
+    await PredictionScore.bulkWrite(ops, { ordered: false });
+  }
+
+  if (!(await renewScoringLock(cohortKey, runId))) {
+    return null;
+  }
+
+  // Drop policies that have left the cohort since the previous run
+  await PredictionScore.deleteMany({ cohortKey, computedAt: { $lt: computedAt } });
+
+  return { cohortKey, size: matrix.size, computedAt, expiresAt };
+}
+
+// Cohort-level rollup shaped like the single-entity predictions, so the
+// dashboard can render it the same way.
+export async function getCohortSummary(cohortKey: string) {
+  const [result] = await PredictionScore.aggregate([
+    // The TTL monitor only sweeps about once a minute, so skip expired scores here
+    { $match: { cohortKey, expiresAt: { $gt: new Date() } } },
+    {
+      $facet: {
+        totals: [
+          {
+            $group: {
+              _id: null,
+              size: { $sum: 1 },
+              renewal: { $avg: '$renewalProbability' },
+              renewalAtRisk: { $sum: { $cond: [{ $lt: ['$renewalProbability', 0.5] }, 1, 0] } },
+              renewalLikely: { $sum: { $cond: [{ $gt: ['$renewalProbability', 0.7] }, 1, 0] } },
+              churn: { $avg: '$churnRisk' },
+              churnHighRisk: { $sum: { $cond: [{ $gt: ['$churnRisk', 0.6] }, 1, 0] } },
+              fraud: { $avg: { $cond: [{ $gt: ['$features.claimCount', 0] }, '$fraudProbability', null] } },
+              fraudFlagged: { $sum: { $cond: [{ $gt: ['$fraudProbability', 0.5] }, 1, 0] } },
+              computedAt: { $min: '$computedAt' },
+              expiresAt: { $min: '$expiresAt' },
+              modelVersion: { $first: '$modelVersion' },
+            },
+          },
+        ],
+        upsell: [
+          { $unwind: '$upsell' },
+          {
+            $group: {
+              _id: '$upsell.product',
+              reason: { $first: '$upsell.reason' },
+              confidence: { $avg: '$upsell.confidence' },
+              estimatedPremium: { $avg: '$upsell.estimatedPremium' },
+              customers: { $sum: 1 },
+            },
+          },
+          { $sort: { customers: -1, _id: 1 } },
+        ],
+      },
+    },
+  ]);
+
+  const totals = result?.totals?.[0];
+  if (!totals) {
+    return null;
+  }
+
+  const recommendations = result.upsell.map((item: any) => ({
+    product: item._id,
+    reason: item.reason,
+    confidence: item.confidence,
+    estimatedPremium: Math.round(item.estimatedPremium),
+    customers: item.customers,
+  }));
+
+  return {
+    cohortKey,
+    size: totals.size,
+    computedAt: totals.computedAt,
+    expiresAt: totals.expiresAt,
+    modelVersion: totals.modelVersion,
+    renewal: {
+      probability: totals.renewal || 0,
+      confidence: 0.85,
+      factors: { atRisk: totals.renewalAtRisk, likely: totals.renewalLikely },
+      recommendation: renewalRecommendation(totals.renewal || 0),
+    },
+    churn: {
+      riskScore: totals.churn || 0,
+      confidence: 0.82,
+      factors: { highRisk: totals.churnHighRisk },
+      recommendation: churnRecommendation(totals.churn || 0),
+    },
+    fraud: {
+      fraudProbability: totals.fraud || 0,
+      confidence: 0.78,
+      factors: { flagged: totals.fraudFlagged },
+      recommendation: fraudRecommendation(totals.fraud || 0),
+    },
+    upsell: {
+      recommendations,
+      nextBestAction: recommendations.length > 0 ? 'Contact customer for consultation' : 'Focus on retention',
+    },
+  };
+}
@@ -0,0 +1,603 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { Model } from 'mongoose';
+import { ImportJob } from '@/models/ImportJob';
+import { createAuditLog } from '@/lib/audit';
+import { ValidationResult } from '@/lib/validation';
+
+// Bulk NDJSON/CSV import and export shared by the customers, policies and
+// payments `/bulk` routes.
+//
+// Exports stream straight from a Mongo cursor. Rows are only read when the
+// client pulls more data, so a slow consumer never forces the whole
+// collection into memory. Exports are ordered by `_id`; pass `?after=<_id>`
+// to resume an interrupted download.
+//
+// Imports are processed in batches: validate, dedupe against the batch and
+// the database with one `$in` lookup, then a single unordered `bulkWrite`.
+// Progress is streamed back as NDJSON events and persisted on an ImportJob,
+// so an interrupted upload can be re-sent with `?jobId=` and resumes after the
+// last committed batch.
+
+export type BulkFormat = 'ndjson' | 'csv';
+export type BulkEntity = 'customers' | 'policies' | 'payments';
+
+const DEFAULT_BATCH_SIZE = 1000;
+const MAX_BATCH_SIZE = 5000;
+const EXPORT_CHUNK_ROWS = 200;
+const MAX_REJECTED_SAMPLES = 100;
+// A running job whose progress has not moved for this long is assumed to
+// belong to a crashed worker and may be claimed by a new upload.
+const STALE_JOB_MS = 10 * 60 * 1000;
+
+const encoder = new TextEncoder();
+
+export interface BulkExportOptions {
+  entity: BulkEntity;
+  model: Model<any>;
+  filter: Record<string, any>;
+  columns: string[];
+}
+
+export interface BulkImportOptions {
+  entity: BulkEntity;
+  model: Model<any>;
+  // Unique business key used to dedupe records, e.g. `email` for customers
+  key: string;
+  validate: (record: any) => ValidationResult;
+  // Map a validated input record to the document to insert. `index` is the
+  // 1-based record number and is stable across resumed uploads.
+  toDocument: (record: any, index: number, jobId: string) => Record<string, any>;
+  auditAction: string;
+  auditEntityType: string;
+}
+
+interface ImportProgress {
+  jobId: string;
+  processed: number;
+  inserted: number;
+  duplicates: number;
+  invalid: number;
+  failed: number;
+}
+
+interface RejectedRecord {
+  record: number;
+  field: string;
+  message: string;
+}
+
+export function getBulkFormat(request: NextRequest): BulkFormat {
+  const format = new URL(request.url).searchParams.get('format');
+  if (format === 'csv' || format === 'ndjson') {
+    return format;
+  }
+
+  const contentType = request.headers.get('content-type') || '';
+  const accept = request.headers.get('accept') || '';
+  return contentType.includes('text/csv') || accept.includes('text/csv') ? 'csv' : 'ndjson';
+}
+
+function getBatchSize(request: NextRequest): number {
+  const batchSize = parseInt(new URL(request.url).searchParams.get('batchSize') || '');
+  if (!batchSize || batchSize < 1) {
+    return DEFAULT_BATCH_SIZE;
+  }
+  return Math.min(batchSize, MAX_BATCH_SIZE);
+}
+
+const isObjectId = (value: string | null): boolean => /^[a-f\d]{24}$/i.test(value || '');
+
+// ---------------------------------------------------------------------------
+// Export
+// ---------------------------------------------------------------------------
+
+function formatCsvValue(value: any): string {
+  if (value === undefined || value === null) {
+    return '';
+  }
+
+  let text: string;
+  if (value instanceof Date) {
+    text = value.toISOString();
+  } else if (Array.isArray(value) || (typeof value === 'object' && value._bsontype !== 'ObjectId')) {
+    text = JSON.stringify(value);
+  } else {
+    text = String(value);
+  }
+
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+function serializeRow(doc: any, format: BulkFormat, columns: string[]): string {
+  if (format === 'ndjson') {
+    return JSON.stringify(doc) + '\n';
+  }
+  return columns.map((column) => formatCsvValue(doc[column])).join(',') + '\n';
+}
+
+export function exportResponse(request: NextRequest, options: BulkExportOptions): Response {
+  const format = getBulkFormat(request);
+  const after = new URL(request.url).searchParams.get('after');
+
+  if (after && !isObjectId(after)) {
+    return NextResponse.json(
+      { success: false, error: 'after must be a valid _id' },
+      { status: 400 }
+    );
+  }
+
+  const filter = after ? { ...options.filter, _id: { $gt: after } } : options.filter;
+  const columns = ['_id', ...options.columns];
+  const cursor = options.model
+    .find(filter)
+    .sort({ _id: 1 })
+    .lean()
+    .cursor({ batchSize: getBatchSize(request) });
+
+  let headerSent = false;
+
+  // Pull-based: the next rows are only read from the cursor when the
+  // consumer has drained what was already enqueued.
+  const stream = new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      try {
+        let chunk = '';
+        if (format === 'csv' && !headerSent) {
+          chunk += columns.join(',') + '\n';
+          headerSent = true;
+        }
+
+        for (let i = 0; i < EXPORT_CHUNK_ROWS; i++) {
+          const doc = await cursor.next();
+          if (!doc) {
+            if (chunk) controller.enqueue(encoder.encode(chunk));
+            await cursor.close();
+            controller.close();
+            return;
+          }
+          chunk += serializeRow(doc, format, columns);
+        }
+
+        controller.enqueue(encoder.encode(chunk));
+      } catch (error) {
+        console.error(`Error exporting ${options.entity}:`, error);
+        await cursor.close().catch(() => {});
+        controller.error(error);
+      }
+    },
+    async cancel() {
+      await cursor.close();
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': format === 'csv' ? 'text/csv; charset=utf-8' : 'application/x-ndjson',
+      'Content-Disposition': `attachment; filename="${options.entity}-export.${format === 'csv' ? 'csv' : 'ndjson'}"`,
+      'Cache-Control': 'no-store',
+    },
+  });
+}
+
+// ---------------------------------------------------------------------------
+// Import
+// ---------------------------------------------------------------------------
+
+function parseCsvValue(value: string): any {
+  if (value === '') {
+    return undefined;
+  }
+  if (value.startsWith('[') || value.startsWith('{')) {
+    try {
+      return JSON.parse(value);
+    } catch {
+      return value;
+    }
+  }
+  return value;
+}
+
+// Incremental RFC 4180 parser; quoted fields may span chunk boundaries and lines.
+class CsvParser {
+  private field = '';
+  private row: string[] = [];
+  private inQuotes = false;
+  private afterClosingQuote = false;
+
+  push(text: string): string[][] {
+    const rows: string[][] = [];
+
+    for (const char of text) {
+      if (this.inQuotes) {
+        if (char === '"') {
+          this.inQuotes = false;
+          this.afterClosingQuote = true;
+        } else {
+          this.field += char;
+        }
+        continue;
+      }
+
+      if (char === '"') {
+        // `""` inside a quoted field is an escaped quote
+        if (this.afterClosingQuote) this.field += '"';
+        this.inQuotes = true;
+      } else if (char === ',') {
+        this.row.push(this.field);
+        this.field = '';
+      } else if (char === '\n') {
+        this.endRow(rows);
+      } else if (char !== '\r') {
+        this.field += char;
+      }
+      this.afterClosingQuote = false;
+    }
+
+    return rows;
+  }
+
+  flush(): string[][] {
+    const rows: string[][] = [];
+    this.endRow(rows);
+    return rows;
+  }
+
+  private endRow(rows: string[][]) {
+    this.row.push(this.field);
+    if (this.row.length > 1 || this.row[0] !== '') {
+      rows.push(this.row);
+    }
+    this.row = [];
+    this.field = '';
+  }
+}
+
+// Yields parsed records, or an Error for lines that could not be parsed.
+async function* readRecords(
+  body: ReadableStream<Uint8Array>,
+  format: BulkFormat
+): AsyncGenerator<any> {
+  const decoder = new TextDecoder();
+  const reader = body.getReader();
+
+  if (format === 'csv') {
+    const parser = new CsvParser();
+    let header: string[] | null = null;
+
+    const toRecords = function* (rows: string[][]) {
+      for (const row of rows) {
+        if (!header) {
+          header = row.map((name) => name.trim());
+          continue;
+        }
+        const record: Record<string, any> = {};
+        header.forEach((name, i) => {
+          const value = parseCsvValue(row[i] ?? '');
+          if (value !== undefined) record[name] = value;
+        });
+        yield record;
+      }
+    };
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      yield* toRecords(parser.push(decoder.decode(value, { stream: true })));
+    }
+    yield* toRecords(parser.push(decoder.decode()));
+    yield* toRecords(parser.flush());
+    return;
+  }
+
+  let buffered = '';
+  const parseLine = (line: string) => {
+    try {
+      return JSON.parse(line);
+    } catch {
+      return new Error('Malformed JSON line');
+    }
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffered += decoder.decode(value, { stream: true });
+
+    let newline: number;
+    while ((newline = buffered.indexOf('\n')) !== -1) {
+      const line = buffered.slice(0, newline).trim();
+      buffered = buffered.slice(newline + 1);
+      if (line) yield parseLine(line);
+    }
+  }
+
+  buffered += decoder.decode();
+  if (buffered.trim()) {
+    yield parseLine(buffered.trim());
+  }
+}
+
+function isDuplicateKeyError(error: any): boolean {
+  return error?.code === 11000 || error?.err?.code === 11000;
+}
+
+function newLeaseId(): string {
+  return `${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
+}
+
+async function writeBatch(
+  options: BulkImportOptions,
+  batch: { index: number; record: any }[],
+  jobId: string
+) {
+  const counts = { inserted: 0, duplicates: 0, invalid: 0, failed: 0 };
+  const rejected: RejectedRecord[] = [];
+  const candidates: { index: number; doc: Record<string, any> }[] = [];
+  const seen = new Set<string>();
+
+  for (const { index, record } of batch) {
+    if (record instanceof Error || typeof record !== 'object' || record === null) {
+      counts.invalid++;
+      rejected.push({ record: index, field: '_record', message: record instanceof Error ? record.message : 'Record must be an object' });
+      continue;
+    }
+
+    const validation = options.validate(record);
+    if (!validation.isValid) {
+      counts.invalid++;
+      rejected.push({ record: index, ...validation.errors[0] });
+      continue;
+    }
+
+    const doc = options.toDocument(record, index, jobId);
+    const key = String(doc[options.key]);
+    if (seen.has(key)) {
+      counts.duplicates++;
+      continue;
+    }
+    seen.add(key);
+    candidates.push({ index, doc });
+  }
+
+  if (candidates.length === 0) {
+    return { counts, rejected };
+  }
+
+  // One set-based lookup per batch instead of a findOne per record
+  const existing = await options.model
+    .find({ [options.key]: { $in: Array.from(seen) } })
+    .select({ [options.key]: 1, _id: 0 })
+    .lean();
+  const existingKeys = new Set(existing.map((doc: any) => String(doc[options.key])));
+
+  const fresh = candidates.filter(({ doc }) => !existingKeys.has(String(doc[options.key])));
+  counts.duplicates += candidates.length - fresh.length;
+
+  if (fresh.length === 0) {
+    return { counts, rejected };
+  }
+
+  // Run the schema validation here rather than leaving it to bulkWrite: with
+  // ordered=false Mongoose silently drops invalid documents, which shifts the
+  // driver's write-error indexes away from our records. Only documents that
+  // pass are sent, so `writeError.index` maps straight into `valid`.
+  const validated = await Promise.all(
+    fresh.map(({ doc }) =>
+      new options.model(doc).validate().then(
+        () => null,
+        (error: any) => error
+      )
+    )
+  );
+  const valid: typeof fresh = [];
+  fresh.forEach((candidate, i) => {
+    const error = validated[i];
+    if (error) {
+      counts.failed++;
+      const field = Object.keys(error.errors || {})[0] || '_validation';
+      rejected.push({ record: candidate.index, field, message: error.message });
+    } else {
+      valid.push(candidate);
+    }
+  });
+
+  if (valid.length === 0) {
+    return { counts, rejected };
+  }
+
+  let outcome: any;
+  let writeErrors: any[] = [];
+  try {
+    outcome = await options.model.bulkWrite(
+      valid.map(({ doc }) => ({ insertOne: { document: doc } })),
+      { ordered: false }
+    );
+  } catch (error: any) {
+    // With ordered=false every valid document is still written; only the
+    // individual write errors need to be accounted for.
+    if (!error?.writeErrors && !error?.result) {
+      throw error;
+    }
+    outcome = error;
+    writeErrors = Array.isArray(error.writeErrors) ? error.writeErrors : [error.writeErrors].filter(Boolean);
+  }
+
+  counts.inserted = outcome?.insertedCount ?? outcome?.result?.insertedCount ?? valid.length - writeErrors.length;
+
+  for (const writeError of writeErrors) {
+    if (isDuplicateKeyError(writeError)) {
+      counts.duplicates++;
+    } else {
+      counts.failed++;
+      rejected.push({ record: valid[writeError.index].index, field: '_write', message: writeError.errmsg || 'Write failed' });
+    }
+  }
+
+  return { counts, rejected };
+}
+
+export async function importResponse(request: NextRequest, options: BulkImportOptions): Promise<Response> {
+  const { searchParams } = new URL(request.url);
+  const format = getBulkFormat(request);
+  const batchSize = getBatchSize(request);
+  const userId = searchParams.get('userId') || 'system';
+  const resumeJobId = searchParams.get('jobId');
+
+  if (!request.body) {
+    return NextResponse.json(
+      { success: false, error: 'Request body is required' },
+      { status: 400 }
+    );
+  }
+
+  // Every upload holds a lease on its job; progress writes are conditioned on
+  // it, so a worker that lost the job to a newer upload stops instead of
+  // double-counting.
+  const leaseId = newLeaseId();
+  let job: any;
+  if (resumeJobId) {
+    job = await ImportJob.findOneAndUpdate(
+      {
+        jobId: resumeJobId,
+        entity: options.entity,
+        status: { $ne: 'completed' },
+        $or: [
+          { status: { $ne: 'running' } },
+          { updatedAt: { $lt: new Date(Date.now() - STALE_JOB_MS) } },
+        ],
+      },
+      { $set: { status: 'running', leaseId, updatedAt: new Date() } },
+      { new: true }
+    ).lean();
+
+    if (!job) {
+      const existing: any = await ImportJob.findOne({ jobId: resumeJobId }).lean();
+      if (!existing) {
+        return NextResponse.json(
+          { success: false, error: 'Import job not found' },
+          { status: 404 }
+        );
+      }
+      if (existing.entity !== options.entity) {
+        return NextResponse.json(
+          { success: false, error: `Import job ${resumeJobId} belongs to ${existing.entity}` },
+          { status: 400 }
+        );
+      }
+      if (existing.status === 'completed') {
+        return NextResponse.json({ success: true, data: existing });
+      }
+      return NextResponse.json(
+        { success: false, error: 'Import job is already running' },
+        { status: 409 }
+      );
+    }
+  } else {
+    job = await ImportJob.create({
+      jobId: `IMP-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`,
+      entity: options.entity,
+      format,
+      userId,
+      leaseId,
+    });
+  }
+
+  const jobId: string = job.jobId;
+  const skip: number = job.processed || 0;
+  const progress: ImportProgress = {
+    jobId,
+    processed: skip,
+    inserted: job.inserted || 0,
+    duplicates: job.duplicates || 0,
+    invalid: job.invalid || 0,
+    failed: job.failed || 0,
+  };
+  const body = request.body;
+
+  const stream = new ReadableStream<Uint8Array>({
+    async start(controller) {
+      const emit = (event: Record<string, any>) => {
+        controller.enqueue(encoder.encode(JSON.stringify(event) + '\n'));
+      };
+
+      const flush = async (batch: { index: number; record: any }[]) => {
+        const { counts, rejected } = await writeBatch(options, batch, jobId);
+        const processed = batch[batch.length - 1].index;
+
+        progress.processed = processed;
+        progress.inserted += counts.inserted;
+        progress.duplicates += counts.duplicates;
+        progress.invalid += counts.invalid;
+        progress.failed += counts.failed;
+
+        // Only advance `processed` once the batch is written, so a resumed
+        // upload never skips records that were not committed.
+        const update = await ImportJob.updateOne(
+          { jobId, leaseId },
+          {
+            $set: { processed, updatedAt: new Date() },
+            $inc: counts,
+            $push: { rejected: { $each: rejected, $slice: MAX_REJECTED_SAMPLES } },
+          }
+        );
+        if (update.matchedCount === 0) {
+          throw new Error('Import job was claimed by another upload');
+        }
+
+        emit({ type: 'progress', ...progress, rejected });
+      };
+
+      try {
+        let index = 0;
+        let batch: { index: number; record: any }[] = [];
+
+        for await (const record of readRecords(body, format)) {
+          index++;
+          if (index <= skip) continue;
+
+          batch.push({ index, record });
+          if (batch.length >= batchSize) {
+            await flush(batch);
+            batch = [];
+          }
+        }
+
+        if (batch.length > 0) {
+          await flush(batch);
+        }
+
+        await ImportJob.updateOne(
+          { jobId, leaseId },
+          { $set: { status: 'completed', completedAt: new Date(), updatedAt: new Date() } }
+        );
+
+        await createAuditLog({
+          action: options.auditAction,
+          entityType: options.auditEntityType,
+          entityId: jobId,
+          changes: { ...progress },
+          userId,
+        });
+
+        emit({ type: 'complete', ...progress });
+      } catch (error: any) {
+        console.error(`Error importing ${options.entity}:`, error);
+        await ImportJob.updateOne(
+          { jobId, leaseId },
+          { $set: { status: 'failed', lastError: error?.message || 'Import failed', updatedAt: new Date() } }
+        ).catch(() => {});
+        emit({ type: 'error', ...progress, error: 'Import failed, resume with the same jobId' });
+      } finally {
+        controller.close();
+      }
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': 'application/x-ndjson',
+      'Cache-Control': 'no-store',
+      'X-Import-Job-Id': jobId,
+    },
+  });
+}
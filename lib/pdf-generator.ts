@@ -1,4 +1,4 @@
-import jsPDF from 'jspdf';
+import type jsPDF from 'jspdf';
 
 export interface LoanApplicationData {
   loanId: string;
@@ -21,8 +21,10 @@ export interface LoanApplicationData {
   createdAt: string;
 }
 
-export function generateLoanPDF(data: LoanApplicationData): jsPDF {
-  const doc = new jsPDF({
+export async function generateLoanPDF(data: LoanApplicationData): Promise<jsPDF> {
+  // Loaded lazily so jsPDF stays out of the bundles of pages that import this module
+  const { default: JsPDF } = await import('jspdf');
+  const doc = new JsPDF({
     orientation: 'portrait',
     unit: 'mm',
     format: 'a4',
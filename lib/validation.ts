@@ -70,6 +70,12 @@ export const validateIncome = (income: string): boolean => {
   return incomeNum > 0 && incomeNum <= 100000000;
 };
 
+// Amount parsing: money is stored as display strings such as "₹50,00,000"
+export const parseAmount = (amount: unknown): number => {
+  if (typeof amount === 'number') return Number.isFinite(amount) ? amount : 0;
+  return parseInt(String(amount ?? '').replace(/\D/g, '')) || 0;
+};
+
 // Policy form validation
 export const validatePolicyForm = (formData: any): ValidationResult => {
   const errors: ValidationError[] = [];
@@ -256,3 +262,125 @@ export const validateClaimForm = (formData: any): ValidationResult => {
     errors
   };
 };
+
+// Record-level validation for bulk imports. These take database-shaped
+// records (as in the Customer/Policy/Payment models) rather than form state.
+
+const isValidDate = (value: any): boolean => {
+  return !!value && !isNaN(new Date(value).getTime());
+};
+
+const isObjectId = (value: any): boolean => {
+  return /^[a-f\d]{24}$/i.test(String(value ?? ''));
+};
+
+// Customer record validation
+export const validateCustomerRecord = (record: any): ValidationResult => {
+  const errors: ValidationError[] = [];
+
+  if (!String(record.name ?? '').trim()) {
+    errors.push({ field: 'name', message: 'Name is required' });
+  }
+
+  if (!String(record.email ?? '').trim()) {
+    errors.push({ field: 'email', message: 'Email is required' });
+  } else if (!validateEmail(String(record.email))) {
+    errors.push({ field: 'email', message: 'Invalid email format' });
+  }
+
+  if (!String(record.phone ?? '').trim()) {
+    errors.push({ field: 'phone', message: 'Phone is required' });
+  } else if (!validatePhone(String(record.phone))) {
+    errors.push({ field: 'phone', message: 'Invalid phone number' });
+  }
+
+  if (record.pincode && !validatePincode(String(record.pincode))) {
+    errors.push({ field: 'pincode', message: 'Invalid pincode format' });
+  }
+
+  if (record.panNumber && !validatePAN(String(record.panNumber))) {
+    errors.push({ field: 'panNumber', message: 'Invalid PAN format' });
+  }
+
+  if (record.aadhaarNumber && !validateAadhaar(String(record.aadhaarNumber))) {
+    errors.push({ field: 'aadhaarNumber', message: 'Invalid Aadhaar format' });
+  }
+
+  return {
+    isValid: errors.length === 0,
+    errors
+  };
+};
+
+// Policy record validation
+export const validatePolicyRecord = (record: any): ValidationResult => {
+  const errors: ValidationError[] = [];
+
+  for (const field of ['policyId', 'customerName', 'type', 'premium', 'sumAssured']) {
+    if (!String(record[field] ?? '').trim()) {
+      errors.push({ field, message: `${field} is required` });
+    }
+  }
+
+  if (!String(record.customerEmail ?? '').trim()) {
+    errors.push({ field: 'customerEmail', message: 'Customer email is required' });
+  } else if (!validateEmail(String(record.customerEmail))) {
+    errors.push({ field: 'customerEmail', message: 'Invalid email format' });
+  }
+
+  if (!['life', 'health', 'vehicle', 'property'].includes(record.category)) {
+    errors.push({ field: 'category', message: 'Category must be life, health, vehicle or property' });
+  }
+
+  if (record.status && !['active', 'expired', 'pending'].includes(record.status)) {
+    errors.push({ field: 'status', message: 'Invalid policy status' });
+  }
+
+  for (const field of ['startDate', 'endDate', 'nextPremium']) {
+    if (!isValidDate(record[field])) {
+      errors.push({ field, message: `${field} must be a valid date` });
+    }
+  }
+
+  return {
+    isValid: errors.length === 0,
+    errors
+  };
+};
+
+// Payment record validation
+export const validatePaymentRecord = (record: any): ValidationResult => {
+  const errors: ValidationError[] = [];
+
+  if (!isObjectId(record.customerId)) {
+    errors.push({ field: 'customerId', message: 'Invalid customer ID' });
+  }
+
+  if (!isObjectId(record.policyId)) {
+    errors.push({ field: 'policyId', message: 'Invalid policy ID' });
+  }
+
+  const amount = Number(record.amount);
+  if (!record.amount || isNaN(amount) || amount <= 0) {
+    errors.push({ field: 'amount', message: 'Amount must be a positive number' });
+  }
+
+  if (record.paymentMethod && !['credit_card', 'debit_card', 'net_banking', 'upi', 'cheque'].includes(record.paymentMethod)) {
+    errors.push({ field: 'paymentMethod', message: 'Invalid payment method' });
+  }
+
+  if (record.status && !['pending', 'completed', 'failed', 'refunded'].includes(record.status)) {
+    errors.push({ field: 'status', message: 'Invalid payment status' });
+  }
+
+  for (const field of ['paymentDate', 'dueDate']) {
+    if (record[field] && !isValidDate(record[field])) {
+      errors.push({ field, message: `${field} must be a valid date` });
+    }
+  }
+
+  return {
+    isValid: errors.length === 0,
+    errors
+  };
+};
@@ -73,4 +73,7 @@ const ClaimSchema = new mongoose.Schema({
   }
 });
 
+// Batch scoring joins claims by policy
+ClaimSchema.index({ policyId: 1 });
+
 export const Claim = mongoose.models.Claim || mongoose.model('Claim', ClaimSchema);
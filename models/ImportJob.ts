@@ -0,0 +1,58 @@
+import mongoose from 'mongoose';
+
+const ImportJobSchema = new mongoose.Schema(
+  {
+    jobId: {
+      type: String,
+      required: true,
+      unique: true,
+    },
+    entity: {
+      type: String,
+      enum: ['customers', 'policies', 'payments'],
+      required: true,
+    },
+    format: {
+      type: String,
+      enum: ['ndjson', 'csv'],
+      default: 'ndjson',
+    },
+    status: {
+      type: String,
+      enum: ['running', 'completed', 'failed'],
+      default: 'running',
+    },
+    // Number of input records fully committed; a resumed upload skips this many
+    processed: { type: Number, default: 0 },
+    inserted: { type: Number, default: 0 },
+    duplicates: { type: Number, default: 0 },
+    invalid: { type: Number, default: 0 },
+    failed: { type: Number, default: 0 },
+    // First few rejected records, kept small so multi-million-row jobs stay cheap
+    rejected: [
+      {
+        _id: false,
+        record: Number,
+        field: String,
+        message: String,
+      },
+    ],
+    userId: String,
+    // Lease held by the upload currently processing the job
+    leaseId: String,
+    lastError: String,
+    completedAt: Date,
+    createdAt: {
+      type: Date,
+      default: Date.now,
+    },
+    updatedAt: {
+      type: Date,
+      default: Date.now,
+    },
+  },
+  { timestamps: true }
+);
+
+export const ImportJob =
+  mongoose.models.ImportJob || mongoose.model('ImportJob', ImportJobSchema);
@@ -0,0 +1,33 @@
+import mongoose from 'mongoose';
+
+const PaymentSchema = new mongoose.Schema(
+  {
+    transactionId: { type: String, unique: true },
+    customerId: mongoose.Schema.Types.ObjectId,
+    policyId: mongoose.Schema.Types.ObjectId,
+    amount: Number,
+    paymentMethod: {
+      type: String,
+      enum: ['credit_card', 'debit_card', 'net_banking', 'upi', 'cheque'],
+    },
+    status: {
+      type: String,
+      enum: ['pending', 'completed', 'failed', 'refunded'],
+      default: 'pending',
+    },
+    paymentDate: Date,
+    dueDate: Date,
+    receiptNumber: String,
+    description: String,
+    gatewayResponse: mongoose.Schema.Types.Mixed,
+    createdAt: { type: Date, default: Date.now },
+    updatedAt: { type: Date, default: Date.now },
+  },
+  { timestamps: true }
+);
+
+// Batch scoring joins payments by customer
+PaymentSchema.index({ customerId: 1 });
+
+export const Payment =
+  mongoose.models.Payment || mongoose.model('Payment', PaymentSchema);
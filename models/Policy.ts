@@ -68,4 +68,8 @@ const PolicySchema = new mongoose.Schema({
   }
 });
 
+// Batch scoring selects cohorts by status and due date, and joins a customer's portfolio by email
+PolicySchema.index({ status: 1, nextPremium: 1 });
+PolicySchema.index({ customerEmail: 1 });
+
 export default mongoose.models.Policy || mongoose.model('Policy', PolicySchema);
@@ -0,0 +1,46 @@
+import mongoose from 'mongoose';
+
+const PredictionScoreSchema = new mongoose.Schema(
+  {
+    cohortKey: {
+      type: String,
+      required: true,
+    },
+    policyId: {
+      type: String,
+      required: true,
+    },
+    customerEmail: String,
+    renewalProbability: Number,
+    churnRisk: Number,
+    fraudProbability: Number,
+    upsell: [
+      {
+        _id: false,
+        product: String,
+        reason: String,
+        confidence: Number,
+        estimatedPremium: Number,
+      },
+    ],
+    features: mongoose.Schema.Types.Mixed,
+    modelVersion: String,
+    computedAt: {
+      type: Date,
+      required: true,
+    },
+    expiresAt: {
+      type: Date,
+      required: true,
+      index: { expireAfterSeconds: 0 }, // Auto-delete after expiry
+    },
+  },
+  { timestamps: true }
+);
+
+PredictionScoreSchema.index({ cohortKey: 1, policyId: 1 }, { unique: true });
+PredictionScoreSchema.index({ cohortKey: 1, renewalProbability: 1 });
+PredictionScoreSchema.index({ customerEmail: 1 });
+
+export const PredictionScore =
+  mongoose.models.PredictionScore || mongoose.model('PredictionScore', PredictionScoreSchema);
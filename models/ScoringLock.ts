@@ -0,0 +1,25 @@
+import mongoose from 'mongoose';
+
+// Single-flight lock for batch scoring, one document per cohort
+const ScoringLockSchema = new mongoose.Schema(
+  {
+    cohortKey: {
+      type: String,
+      required: true,
+      unique: true,
+    },
+    runId: {
+      type: String,
+      required: true,
+    },
+    lockedUntil: {
+      type: Date,
+      required: true,
+      index: { expireAfterSeconds: 0 }, // Auto-delete abandoned locks
+    },
+  },
+  { timestamps: true }
+);
+
+export const ScoringLock =
+  mongoose.models.ScoringLock || mongoose.model('ScoringLock', ScoringLockSchema);
@@ -0,0 +1,231 @@
+"""Per-route cold-load benchmark with enforced bundle budgets.
+
+Loads every route listed in ``bundle-budgets.json`` in a fresh, cache-less
+Chromium context against a production server (``npm run build && npm start``)
+and records, per page:
+
+* JavaScript bytes on the wire (compressed) and decoded,
+* script parse/compile/execute time (Chrome's ``ScriptDuration`` metric),
+* a lab time-to-interactive: the end of the last long task (>50ms) after
+  first contentful paint, or DOMContentLoaded if the main thread never blocks.
+
+Each route is loaded ``--runs`` times and the median is compared against the
+route budget. Budgets are not hand-picked: ``--record`` measures the current
+build and writes the medians (plus ``headroom``) back into the budgets file,
+along with the raw baseline. Until a baseline has been recorded the script
+only reports measurements; once one exists, the check exits non-zero when any
+budget is exceeded or a route has no recorded budget, so it can gate CI.
+
+Requires Python ``playwright`` and a Chromium build:
+    pip install -r scripts/requirements.txt
+    python -m playwright install chromium
+
+Usage:
+    python scripts/bundle_budget.py --record          # record baseline budgets
+    python scripts/bundle_budget.py                   # check against them
+    python scripts/bundle_budget.py --routes /dashboard /claims --runs 5
+    python scripts/bundle_budget.py --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BUDGETS = ROOT / "bundle-budgets.json"
+BUDGET_METRICS = ("scriptKb", "scriptDurationMs", "ttiMs")
+DEFAULT_HEADROOM = 0.1
+
+# Pages read the signed-in user from localStorage; seed one so protected
+# routes render their real content instead of bailing out early.
+SEED_USER = json.dumps({"email": "benchmark@example.com", "name": "Benchmark"})
+
+LONG_TASK_OBSERVER = """
+window.__longTasks = [];
+try {
+  new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      window.__longTasks.push(entry.startTime + entry.duration);
+    }
+  }).observe({ type: "longtask", buffered: true });
+} catch (e) {}
+try { localStorage.setItem("user", %s); } catch (e) {}
+""" % json.dumps(SEED_USER)
+
+COLLECT_TIMINGS = """
+() => {
+  const nav = performance.getEntriesByType("navigation")[0];
+  const fcp = performance.getEntriesByName("first-contentful-paint")[0];
+  return {
+    domContentLoaded: nav ? nav.domContentLoadedEventEnd : 0,
+    fcp: fcp ? fcp.startTime : 0,
+    longTasks: window.__longTasks || [],
+  };
+}
+"""
+
+
+async def measure_route(browser, base_url, route, settle_ms):
+    """Cold-load a single route and return its JS/timing metrics."""
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        await page.add_init_script(LONG_TASK_OBSERVER)
+
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send("Network.setCacheDisabled", {"cacheDisabled": True})
+        await cdp.send("Performance.enable")
+
+        scripts = {}
+
+        def on_response(event):
+            if event.get("type") == "Script":
+                scripts[event["requestId"]] = {"encoded": 0, "decoded": 0}
+
+        def on_data(event):
+            entry = scripts.get(event["requestId"])
+            if entry is not None:
+                entry["decoded"] += event.get("dataLength", 0)
+
+        def on_finished(event):
+            entry = scripts.get(event["requestId"])
+            if entry is not None:
+                entry["encoded"] = event.get("encodedDataLength", 0)
+
+        cdp.on("Network.responseReceived", on_response)
+        cdp.on("Network.dataReceived", on_data)
+        cdp.on("Network.loadingFinished", on_finished)
+
+        await page.goto(base_url.rstrip("/") + route, wait_until="networkidle", timeout=60000)
+        # Give deferred chunks and hydration a chance to run before sampling.
+        await page.wait_for_timeout(settle_ms)
+
+        metrics = {m["name"]: m["value"] for m in (await cdp.send("Performance.getMetrics"))["metrics"]}
+        timings = await page.evaluate(COLLECT_TIMINGS)
+
+        after_fcp = [end for end in timings["longTasks"] if end >= timings["fcp"]]
+        tti = max([timings["domContentLoaded"], *after_fcp])
+
+        return {
+            "scriptKb": sum(s["encoded"] for s in scripts.values()) / 1024,
+            "decodedKb": sum(s["decoded"] for s in scripts.values()) / 1024,
+            "scriptCount": len(scripts),
+            "scriptDurationMs": metrics.get("ScriptDuration", 0) * 1000,
+            "ttiMs": tti,
+        }
+    finally:
+        await context.close()
+
+
+def median_of(samples):
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def check_budget(result, budget):
+    """Return the list of human-readable budget violations for a route."""
+    if not budget:
+        return ["no recorded budget, run with --record"]
+
+    failures = []
+    for key, limit in budget.items():
+        if key in result and result[key] > limit:
+            failures.append(f"{key} {result[key]:.0f} > {limit}")
+    return failures
+
+
+def record_budgets(config, results, headroom):
+    """Store measured medians as the baseline and derive budgets from them."""
+    for route, result in results.items():
+        config["routes"][route] = {
+            metric: int(result[metric] * (1 + headroom)) + 1 for metric in BUDGET_METRICS
+        }
+    config["baseline"] = {
+        "recordedAt": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+        "routes": {
+            route: {key: round(value, 1) for key, value in result.items()}
+            for route, result in results.items()
+        },
+    }
+
+
+async def run(args):
+    budgets_path = Path(args.budgets)
+    config = json.loads(budgets_path.read_text())
+    base_url = args.base_url or config.get("baseUrl", "http://localhost:3000")
+    headroom = config.get("headroom", DEFAULT_HEADROOM)
+    routes = args.routes or list(config["routes"].keys())
+    # Budgets are only enforced once a real build has been measured with --record
+    enforced = "baseline" in config
+
+    measured = {}
+    results = {}
+    failed = False
+
+    pw = await async_api.async_playwright().start()
+    browser = await pw.chromium.launch(
+        headless=True,
+        executable_path=args.chromium,
+        args=["--disable-dev-shm-usage"],
+    )
+    try:
+        print(f"{'route':<16}{'js kB':>9}{'decoded':>10}{'files':>7}{'script ms':>11}{'tti ms':>9}  status")
+        for route in routes:
+            samples = [await measure_route(browser, base_url, route, args.settle) for _ in range(args.runs)]
+            result = median_of(samples)
+            measured[route] = result
+
+            if args.record:
+                status = "recorded"
+            elif not enforced:
+                status = "measured"
+            else:
+                budget = config["routes"].get(route) or {}
+                failures = check_budget(result, budget)
+                failed = failed or bool(failures)
+                results[route] = {**result, "budget": budget, "failures": failures}
+                status = "ok" if not failures else "FAIL: " + ", ".join(failures)
+
+            print(
+                f"{route:<16}{result['scriptKb']:>9.0f}{result['decodedKb']:>10.0f}"
+                f"{result['scriptCount']:>7.0f}{result['scriptDurationMs']:>11.0f}{result['ttiMs']:>9.0f}  {status}"
+            )
+    finally:
+        await browser.close()
+        await pw.stop()
+
+    if args.record:
+        record_budgets(config, measured, headroom)
+        budgets_path.write_text(json.dumps(config, indent=2) + "\n")
+        print(f"Recorded budgets for {len(measured)} routes in {budgets_path}")
+
+    elif not enforced:
+        print(f"No baseline recorded in {budgets_path}; budgets are not enforced until you run with --record")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results or measured, indent=2))
+
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budgets", default=str(DEFAULT_BUDGETS), help="path to the budgets JSON file")
+    parser.add_argument("--base-url", help="server to benchmark (defaults to baseUrl in the budgets file)")
+    parser.add_argument("--routes", nargs="+", help="only benchmark these routes")
+    parser.add_argument("--runs", type=int, default=3, help="cold loads per route; the median is reported")
+    parser.add_argument("--settle", type=int, default=2000, help="ms to wait after network idle before sampling")
+    parser.add_argument("--record", action="store_true", help="write measured medians (plus headroom) as the budgets")
+    parser.add_argument("--chromium", help="path to a Chromium/Chrome binary instead of Playwright's bundled one")
+    parser.add_argument("--json", help="write the full results to this file")
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import { parseAmount } from '../lib/validation.ts';
+
+test('parses display-formatted rupee amounts', () => {
+  assert.equal(parseAmount('₹50,00,000'), 5000000);
+  assert.equal(parseAmount('₹1,25,000'), 125000);
+  assert.equal(parseAmount('25000'), 25000);
+});
+
+test('passes numbers through and treats missing values as zero', () => {
+  assert.equal(parseAmount(750000), 750000);
+  assert.equal(parseAmount(undefined), 0);
+  assert.equal(parseAmount(null), 0);
+  assert.equal(parseAmount('N/A'), 0);
+});